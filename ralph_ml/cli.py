@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -187,14 +188,17 @@ def resume(
         sys.exit(1)
 
     # Load state
-    with open(state_path) as f:
-        state_data = json.load(f)
+    state_data = orjson.loads(state_path.read_bytes())
 
     # Reconstruct config from state
     ralph_config = RalphMLConfig.model_validate(state_data["config"])
 
     # Create orchestrator with existing state
-    orchestrator = Orchestrator(ralph_config, state_path=state_path)
+    try:
+        orchestrator = Orchestrator(ralph_config, state_path=state_path)
+    except ValueError as exc:
+        console.print(f"❌ {exc}")
+        sys.exit(1)
 
     console.print(f"🔄 Resuming from cycle {orchestrator.state.current_cycle}")
     if orchestrator.state.best_metric is None:
@@ -266,8 +270,7 @@ def status() -> None:
             state_file = legacy_state_file
 
     if state_file and state_file.exists():
-        with open(state_file) as f:
-            state_data = json.load(f)
+        state_data = orjson.loads(state_file.read_bytes())
 
         console.print(f"\n📁 State: {state_file}")
         console.print(f"   Status: {state_data.get('status', 'unknown')}")
@@ -356,17 +359,15 @@ def report(
         lines.append(f"### {cycle_name}")
 
         if metrics_file.exists():
-            with open(metrics_file) as f:
-                metrics = json.load(f)
-                lines.append(f"Cycle: {metrics.get('cycle', 'N/A')}")
-                lines.append(f"Result: {json.dumps(metrics.get('result', {}), indent=2)}")
-                lines.append(f"Runtime: {metrics.get('runtime', {})}")
+            metrics = orjson.loads(metrics_file.read_bytes())
+            lines.append(f"Cycle: {metrics.get('cycle', 'N/A')}")
+            lines.append(f"Result: {json.dumps(metrics.get('result', {}), indent=2)}")
+            lines.append(f"Runtime: {metrics.get('runtime', {})}")
 
         if analysis_file.exists():
-            with open(analysis_file) as f:
-                analysis = json.load(f)
-                lines.append(f"\nSummary: {analysis.get('summary', 'N/A')}")
-                lines.append(f"Decision: {analysis.get('decision', {}).get('action', 'N/A')}")
+            analysis = orjson.loads(analysis_file.read_bytes())
+            lines.append(f"\nSummary: {analysis.get('summary', 'N/A')}")
+            lines.append(f"Decision: {analysis.get('decision', {}).get('action', 'N/A')}")
 
         lines.append("")
 
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class TargetMetric(BaseModel):
@@ -195,6 +195,13 @@ class MetricsResult(BaseModel):
 
     resources: Resources = Field(default_factory=Resources, description="Resource metrics")
 
+    def get_target_value(self) -> Any:
+        """Get the reported value of the target metric, or None if it is missing."""
+        name = self.target.name
+        if name in self.ResultMetrics.model_fields:
+            return getattr(self.result, name)
+        return (self.result.model_extra or {}).get(name)
+
 
 class Recommendation(BaseModel):
     """A single recommendation."""
@@ -234,6 +241,12 @@ class CycleSnapshot(BaseModel):
     source_snapshot_dir: Optional[str] = None
 
 
+def _metric_entry(snapshot: CycleSnapshot) -> tuple[int, Optional[float]]:
+    """Build a snapshot's ``metric_history`` entry: its cycle and numeric target value."""
+    value = snapshot.metrics.get_target_value()
+    return snapshot.cycle_number, float(value) if isinstance(value, (int, float)) else None
+
+
 class RalphState(BaseModel):
     """Orchestrator state (resumable)."""
 
@@ -242,19 +255,30 @@ class RalphState(BaseModel):
     best_metric: Optional[float] = Field(None, description="Best metric achieved so far")
     best_cycle: int = Field(0, description="Cycle number with best metric")
     history: list[CycleSnapshot] = Field(default_factory=list, description="Cycle history")
+    metric_history: list[tuple[int, Optional[float]]] = Field(
+        default_factory=list, description="(cycle number, target metric value) per cycle"
+    )
     status: str = Field(default="idle", description="Current status")
     start_time: Optional[str] = None
     last_update: Optional[str] = None
 
+    @model_validator(mode="after")
+    def _fill_metric_history(self) -> "RalphState":
+        """Derive the metric index for states saved before it existed."""
+        if not self.metric_history and self.history:
+            self.metric_history.extend(_metric_entry(snapshot) for snapshot in self.history)
+        return self
+
     def add_cycle(self, snapshot: CycleSnapshot) -> None:
         """Add a cycle to history."""
         self.history.append(snapshot)
         self.current_cycle = snapshot.cycle_number
 
         # Update best metric
-        target_name = snapshot.metrics.target.name
-        current_value = snapshot.metrics.result.model_dump().get(target_name)
-        if isinstance(current_value, (int, float)):
+        entry = _metric_entry(snapshot)
+        self.metric_history.append(entry)
+        current_value = entry[1]
+        if current_value is not None:
             if snapshot.metrics.target.is_better(current_value, self.best_metric):
                 self.best_metric = current_value
                 self.best_cycle = snapshot.cycle_number
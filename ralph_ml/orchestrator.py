@@ -1,16 +1,31 @@
 """Orchestrator for Ralph ML Loop."""
 
+import errno
 import json
 import os
+import re
+import select
 import selectors
 import shutil
+import signal
+import stat
 import subprocess
-import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from hashlib import sha256
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Sequence
+
+import orjson
+from pydantic import BaseModel
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
 
 from ralph_ml.config import (
     CycleAnalysis,
@@ -21,6 +36,269 @@ from ralph_ml.config import (
     Recommendation,
 )
 
+# Candidate model artifact locations, relative to the workspace, in priority order.
+ARTIFACT_RELPATHS = (
+    "best_model.pt",
+    "artifacts/best_model.pt",
+    "outputs/best_model.pt",
+    "model.pth",
+    "checkpoint.pt",
+)
+_ARTIFACT_DIRS = tuple(dict.fromkeys(os.path.dirname(rel_path) for rel_path in ARTIFACT_RELPATHS))
+_ARTIFACT_NAMES = frozenset(os.path.basename(rel_path) for rel_path in ARTIFACT_RELPATHS)
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents with the source on Btrfs/XFS.
+_FICLONE = 0x40049409
+# Errors meaning "this filesystem pair cannot clone / splice", not "the copy failed".
+_CLONE_UNSUPPORTED = frozenset(
+    {
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.ENOTTY,
+    }
+)
+
+# OpenCode prompt templates, filled with str.format_map once per cycle.
+PHASE1_PROMPT_TEMPLATE = """Create or modify a training codebase for this task.
+
+User Request: {prompt}
+Cycle: {cycle_num}
+
+Context from previous cycles:
+{context}
+
+Requirements:
+1. Create a complete, runnable training setup
+2. Include: model.py, train.py, eval.py, data.py, config.json
+3. Use data from: {data_root}
+4. Target: {target_name} {target_sym} {target_value}
+5. Framework: {framework}
+6. Make it deterministic where possible (seeds)
+7. Output metrics to metrics.json after training
+8. If files already exist, update them in place and keep working parts
+9. Do not rewrite from scratch unless files are missing or broken
+10. Training observability is required:
+    - show live progress with tqdm in train.py
+    - print a clear epoch summary line (epoch, train_loss, val_loss, val_acc, test_acc) every epoch
+    - ensure logs flush so progress is visible in real time in non-interactive terminals
+11. Do not execute training/evaluation commands in this phase.
+    - Do not run python train.py, python eval.py, pytest, or any long-running experiments.
+    - Only create/update source files in this phase.
+
+Write the code files directly."""
+
+PHASE3_PROMPT_TEMPLATE = """Analyze the training results and recommend improvements.
+
+Original Request: {prompt}
+Target: {target_name} {target_sym} {target_value}
+Achieved: {achieved}
+
+Context:
+{context}
+
+Tasks:
+1. Analyze what went well and what didn't
+2. Identify specific improvements (architecture, hyperparameters, data, etc.)
+3. Rank recommendations by confidence (high/medium/low)
+4. Decide if we should continue or stop
+
+Output format:
+analysis.md with summary
+recommendations.json with list of recommendations
+decision.json with action (continue/stop) and rationale"""
+
+# Workspace source files fingerprinted and snapshotted every cycle.
+TRACKED_FILES = ("model.py", "train.py", "eval.py", "data.py", "config.json")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _write_bytes(path: Path, data: bytes, *, atomic: bool = False) -> None:
+    """Write ``data`` to ``path`` with raw fd writes.
+
+    With ``atomic=True`` the data is written to a sibling temp file, synced, and moved
+    into place with ``os.replace``, so readers never observe a partially written file
+    and an interrupted cycle leaves the previous version intact.
+    """
+    write_path = path.with_name(f".{path.name}.tmp") if atomic else path
+
+    fd = os.open(write_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        if atomic:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    if atomic:
+        os.replace(write_path, path)
+
+
+def _write_json(path: Path, obj: Any, *, indent: bool = True, atomic: bool = False) -> None:
+    """Serialize a dict or Pydantic model to JSON with orjson and write it to ``path``."""
+    if isinstance(obj, BaseModel):
+        obj = obj.model_dump(mode="json")
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    _write_bytes(path, data, atomic=atomic)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink ``src`` to ``dst``, copying instead when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _clone_file(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` as cheaply as the filesystem allows.
+
+    Tries a reflink (FICLONE) first, then an in-kernel ``os.copy_file_range`` loop, and
+    falls back to ``shutil.copyfile`` only when neither is supported for this file pair.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                    return
+                except OSError as exc:
+                    if exc.errno not in _CLONE_UNSUPPORTED:
+                        raise
+            copy_file_range = getattr(os, "copy_file_range", None)
+            if copy_file_range is not None:
+                while copy_file_range(src_fd, dst_fd, 1 << 30):
+                    pass
+                return
+        except OSError as exc:
+            if exc.errno not in _CLONE_UNSUPPORTED:
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill a process started with ``start_new_session=True`` together with its children."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        proc.kill()
+
+
+# Signals that would end the orchestrator without running any cleanup. Phase processes run in
+# their own session, so they never see these; while one runs, they raise SystemExit instead.
+_TERMINATION_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name)
+)
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    """Signal handler turning a termination signal into ``SystemExit``."""
+    raise SystemExit(128 + signum)
+
+
+def _hash_file(
+    path: Path, copy_to: Optional[Path] = None, buffer: Optional[bytearray] = None
+) -> tuple[str, int, int]:
+    """Stream a file once, returning its SHA-256 hex digest, line count and size in bytes.
+
+    When ``copy_to`` is given, the bytes read are also written there. Passing a
+    ``buffer`` lets callers reuse one read buffer across many files.
+    """
+    buf = buffer if buffer is not None else bytearray(1 << 16)
+    view = memoryview(buf)
+    # A change fingerprint, not a security check; this also keeps it usable under FIPS mode
+    digest = sha256(usedforsecurity=False)
+    newlines = 0
+    size = 0
+    last_byte = 0
+    with open(path, "rb") as f, (open(copy_to, "wb") if copy_to else nullcontext()) as out:
+        while n := f.readinto(buf):
+            chunk = view[:n]
+            digest.update(chunk)
+            newlines += buf.count(b"\n", 0, n)
+            size += n
+            last_byte = buf[n - 1]
+            if out is not None:
+                out.write(chunk)
+
+    line_count = newlines + (1 if size and last_byte != ord("\n") else 0)
+    return digest.hexdigest(), line_count, size
+
+
+def _iter_lines_reversed(path: Path, block_size: int = 1 << 16) -> Iterator[str]:
+    """Yield the text lines of a log file from last to first, reading it backwards in blocks.
+
+    Lines end at newlines and carriage returns alike, so carriage-return progress
+    updates count as separate lines, as with universal-newline text reads.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # Start of the earliest line seen so far, which may continue in the previous block
+        head = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            # Split on every CR and LF, so a newline-free stretch of carriage-return progress
+            # updates only carries its last partial segment into the next block.
+            parts = (f.read(size) + head).replace(b"\r", b"\n").split(b"\n")
+            head = parts[0]
+            for part in reversed(parts[1:]):
+                yield part.decode("utf-8", errors="replace")
+        yield head.decode("utf-8", errors="replace")
+
+
+# Metric values in free-form training output
+_NUMBER_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+_LEADING_NUMBER_RE = re.compile(r"[0-9.]+")
+_HAS_DIGIT = re.compile(r"[0-9]").search
+
+# Selector key data marking the process-exit pidfd in Orchestrator._stream_process.
+_PROCESS_EXIT = object()
+# Line ends for echoed output; a lone carriage return ends a line too, as in text-mode reads,
+# so tqdm progress updates are echoed as they arrive.
+_LINE_END_RE = re.compile(rb"\r\n|\r|\n")
+# Longest unterminated output kept pending before it is echoed as a line of its own.
+_MAX_PENDING_LINE = 1 << 16
+
+
+class _OutputSink:
+    """Write process output to a log file, keeping only a bounded tail in memory."""
+
+    def __init__(self, path: Path, create_empty: bool = True, tail_bytes: int = 4096):
+        self.path = path
+        self._file: Optional[BinaryIO] = open(path, "wb") if create_empty else None
+        self._tail = bytearray()
+        self._tail_bytes = tail_bytes
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk to the log file and the in-memory tail."""
+        if self._file is None:
+            self._file = open(self.path, "wb")
+        self._file.write(chunk)
+        self._tail += chunk
+        if len(self._tail) > 2 * self._tail_bytes:
+            del self._tail[: -self._tail_bytes]
+
+    def close(self) -> None:
+        """Close the log file if it was opened."""
+        if self._file is not None:
+            self._file.close()
+
+    def tail(self) -> str:
+        """Last ``tail_bytes`` of output, decoded as UTF-8."""
+        return bytes(self._tail[-self._tail_bytes :]).decode("utf-8", errors="replace")
+
 
 class Orchestrator:
     """Main orchestrator for Ralph ML Loop."""
@@ -33,9 +311,46 @@ class Orchestrator:
             state_path: Path to save/load state (for resumability)
         """
         self.config = config
-        self.state_path = state_path or config.get_paths()["state"] / "ralph_state.json"
+        self._paths = config.get_paths()
+        self._workspace = self._paths["workspace"]
+        self._workspace_path = self._workspace.resolve()
+        self._runs_dir = self._paths["runs"]
+        self._target = config.project.target_metric
+        self._target_sym = self._target.comparator_symbol()
+        self._target_dir = self._target.get_direction()
+        self._timeout_seconds = config.safeguards.time_limit_per_cycle_minutes * 60
+        # Prompt template fields that stay the same for every cycle of the run
+        self._prompt_fields: dict[str, Any] = {
+            "data_root": config.data.root,
+            "target_name": self._target.name,
+            "target_sym": self._target_sym,
+            "target_value": self._target.value,
+            "framework": config.project.framework,
+        }
+        self.state_path = state_path or self._paths["state"] / "ralph_state.json"
+        # One JSON file per finished cycle, so saving state does not rewrite all history
+        self._history_dir = self.state_path.parent / "history"
+        self._best_index_path = self.state_path.parent.parent / "best_model_index.json"
+        # Directories already created by this run, so repeat saves skip the mkdir walk
+        self._created_dirs: set[Path] = set()
         self.state = self._load_state()
 
+        # Formatted "Cycle N: metric=value" lines, extended by one entry per finished cycle
+        self._history_lines = [
+            self._format_history_line(cycle_number, value)
+            for cycle_number, value in self.state.metric_history
+        ]
+        self._best_snapshot: Optional[CycleSnapshot] = next(
+            (s for s in self.state.history if s.cycle_number == self.state.best_cycle), None
+        )
+
+        # Read buffer shared by every tracked-file hash
+        self._hash_buf = bytearray(1 << 16)
+        # Priority (index into ARTIFACT_RELPATHS) of the last discovered model artifact
+        self._artifact_rank: Optional[int] = None
+        # (source path, mtime_ns, size) of the last copied model artifact and its copy
+        self._artifact_cache: Optional[tuple[tuple[str, int, int], Path]] = None
+
         # Determine OpenCode path (mock or real)
         if config.agents.code_model == "mock_opencode":
             self.opencode_path = str(Path(__file__).resolve().parent.parent / "mock_opencode.py")
@@ -50,87 +365,157 @@ class Orchestrator:
                 self.opencode_path = opencode_from_path
             else:
                 self.opencode_path = default_linux_path
+        self._opencode_cmd = (self.opencode_path, "run")
 
     def _load_state(self) -> RalphState:
-        """Load state from file if exists, otherwise create new."""
+        """Load state from file if exists, otherwise create new.
+
+        Cycle history is read back from the per-cycle files in the history directory.
+        State files written before the split still carry an inline ``history`` list; that
+        history is migrated into the history directory before the header is rewritten.
+
+        Raises:
+            ValueError: If the history directory does not hold every cycle the header records
+        """
         if self.state_path.exists():
             try:
-                with open(self.state_path) as f:
-                    data = json.load(f)
-                return RalphState.model_validate(data)
+                data = orjson.loads(self.state_path.read_bytes())
+                legacy_history = "history" in data
+                if not legacy_history:
+                    current_cycle = data.get("current_cycle", 0)
+                    history = []
+                    for cycle_path in sorted(self._history_dir.glob("cycle_*.json")):
+                        snapshot_data = orjson.loads(cycle_path.read_bytes())
+                        # Skip a snapshot written just before a crash, ahead of the header
+                        if snapshot_data.get("cycle_number", 0) <= current_cycle:
+                            history.append(snapshot_data)
+                    data["history"] = history
+                state = RalphState.model_validate(data)
             except Exception:
                 pass
+            else:
+                if legacy_history:
+                    for snapshot in state.history:
+                        self._save_cycle_snapshot(snapshot)
+                else:
+                    # The header alone is not resumable: without every cycle the context,
+                    # stop checks and best-model pointer would all be built from a gap.
+                    cycle_numbers = [snapshot.cycle_number for snapshot in state.history]
+                    if cycle_numbers != list(range(1, state.current_cycle + 1)):
+                        raise ValueError(
+                            f"State file {self.state_path} records {state.current_cycle} "
+                            f"cycles, but {self._history_dir} holds cycles {cycle_numbers}; "
+                            "restore the history directory next to the state file"
+                        )
+                return state
         return RalphState(config=self.config)
 
     def _save_state(self) -> None:
-        """Save state to file."""
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w") as f:
-            f.write(self.state.model_dump_json(indent=2))
+        """Save the state header (everything but the cycle history) to file."""
+        self._ensure_dir(self.state_path.parent)
+        _write_json(
+            self.state_path,
+            self.state.model_dump(mode="json", exclude={"history"}),
+            atomic=True,
+        )
+
+    def _save_cycle_snapshot(self, snapshot: CycleSnapshot) -> None:
+        """Append a finished cycle to the on-disk history.
+
+        History files only exist for resuming and duplicate the cycle directory's
+        metrics, analysis and architecture log, so they are written compact.
+        """
+        self._ensure_dir(self._history_dir)
+        _write_json(
+            self._history_dir / f"cycle_{snapshot.cycle_number:04d}.json",
+            snapshot,
+            indent=False,
+            atomic=True,
+        )
 
     def _get_cycle_dir(self, cycle_num: int) -> Path:
         """Get directory for a cycle."""
-        cycle_dir = self.config.get_paths()["runs"] / f"cycle_{cycle_num:04d}"
-        cycle_dir.mkdir(parents=True, exist_ok=True)
+        cycle_dir = self._runs_dir / f"cycle_{cycle_num:04d}"
+        self._ensure_dir(cycle_dir)
         return cycle_dir
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create ``path`` and its parents once per run."""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
     def _run_with_heartbeat(
         self,
-        command: list[str],
+        command: Sequence[str],
         cwd: Path,
         timeout_seconds: int,
         phase_label: str,
+        stdout_path: Path,
+        stderr_path: Path,
         heartbeat_seconds: int = 10,
-        input_text: Optional[str] = None,
+        input_bytes: Optional[bytes] = None,
     ) -> tuple[int, str, str, float, bool]:
-        """Run subprocess and print periodic progress until completion."""
-        start = time.time()
+        """Run subprocess, streaming its output to log files and printing periodic progress.
+
+        Returns:
+            Tuple of (returncode, stdout tail, stderr tail, elapsed seconds, timed out)
+        """
+        start = time.monotonic()
         proc = subprocess.Popen(
             command,
             cwd=cwd,
-            stdin=subprocess.PIPE if input_text is not None else None,
+            stdin=subprocess.PIPE if input_bytes is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=0,
+            start_new_session=True,
         )
 
-        timed_out = False
-        while True:
-            elapsed = time.time() - start
-            remaining = timeout_seconds - elapsed
-
-            if remaining <= 0:
-                timed_out = True
-                proc.kill()
-                stdout, stderr = proc.communicate()
-                break
-
-            wait_chunk = min(heartbeat_seconds, max(1, int(remaining)))
-            try:
-                stdout, stderr = proc.communicate(input=input_text, timeout=wait_chunk)
-                break
-            except subprocess.TimeoutExpired:
-                input_text = None
-                elapsed = time.time() - start
-                print(
-                    f"   ... {phase_label} still running ({elapsed:.0f}s / {timeout_seconds}s, pid={proc.pid})"
-                )
-                sys.stdout.flush()
+        stdout_sink = _OutputSink(stdout_path)
+        stderr_sink = _OutputSink(stderr_path, create_empty=False)
+        try:
+            timed_out = self._stream_process(
+                proc,
+                stdout_sink,
+                stderr_sink,
+                timeout_seconds=timeout_seconds,
+                heartbeat_seconds=heartbeat_seconds,
+                phase_label=phase_label,
+                input_bytes=input_bytes,
+            )
+        finally:
+            stdout_sink.close()
+            stderr_sink.close()
 
-        elapsed_total = time.time() - start
-        return (proc.returncode or 0), stdout, stderr, elapsed_total, timed_out
+        elapsed_total = time.monotonic() - start
+        return (
+            proc.returncode or 0,
+            stdout_sink.tail(),
+            stderr_sink.tail(),
+            elapsed_total,
+            timed_out,
+        )
 
     def _run_training_with_live_logs(
         self,
         command: list[str],
         cwd: Path,
         timeout_seconds: int,
+        stdout_path: Path,
+        stderr_path: Path,
         heartbeat_seconds: int = 10,
     ) -> tuple[int, str, str, float, bool]:
-        """Run training and stream stdout/stderr lines live."""
-        start = time.time()
-        env = os.environ.copy()
-        env["PYTHONUNBUFFERED"] = "1"
+        """Run training, streaming stdout/stderr lines live and into log files.
+
+        Returns:
+            Tuple of (returncode, stdout tail, stderr tail, elapsed seconds, timed out)
+        """
+        start = time.monotonic()
+        # Inherit the environment as-is when it already asks for unbuffered output
+        env: Optional[dict[str, str]] = None
+        if os.environ.get("PYTHONUNBUFFERED") != "1":
+            env = {**os.environ, "PYTHONUNBUFFERED": "1"}
 
         proc = subprocess.Popen(
             command,
@@ -138,78 +523,208 @@ class Orchestrator:
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            bufsize=0,
+            start_new_session=True,
         )
 
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
-        timed_out = False
-        last_heartbeat = start
-
-        sel = selectors.DefaultSelector()
-        if proc.stdout is not None:
-            sel.register(proc.stdout, selectors.EVENT_READ)
-        if proc.stderr is not None:
-            sel.register(proc.stderr, selectors.EVENT_READ)
-
-        while True:
-            now = time.time()
-            elapsed = now - start
-
-            if elapsed > timeout_seconds:
-                timed_out = True
-                proc.kill()
-                break
-
-            events = sel.select(timeout=1.0)
-            for key, _ in events:
-                line = key.fileobj.readline()
-                if not line:
-                    continue
-
-                if proc.stdout is not None and key.fileobj is proc.stdout:
-                    stdout_lines.append(line)
-                    print(f"   [train] {line.rstrip()}")
-                else:
-                    stderr_lines.append(line)
-                    print(f"   [train:err] {line.rstrip()}")
-                sys.stdout.flush()
-
-            if proc.poll() is not None:
-                break
+        stdout_sink = _OutputSink(stdout_path)
+        stderr_sink = _OutputSink(stderr_path, create_empty=False)
+        try:
+            timed_out = self._stream_process(
+                proc,
+                stdout_sink,
+                stderr_sink,
+                timeout_seconds=timeout_seconds,
+                heartbeat_seconds=heartbeat_seconds,
+                phase_label="Phase 2 training",
+                line_prefixes=("   [train] ", "   [train:err] "),
+            )
+        finally:
+            stdout_sink.close()
+            stderr_sink.close()
 
-            if now - last_heartbeat >= heartbeat_seconds:
-                print(
-                    f"   ... Phase 2 training still running ({elapsed:.0f}s / {timeout_seconds}s, pid={proc.pid})"
-                )
-                sys.stdout.flush()
-                last_heartbeat = now
-
-        if proc.stdout is not None:
-            remainder = proc.stdout.read()
-            if remainder:
-                stdout_lines.append(remainder)
-                for line in remainder.splitlines():
-                    print(f"   [train] {line}")
-        if proc.stderr is not None:
-            remainder = proc.stderr.read()
-            if remainder:
-                stderr_lines.append(remainder)
-                for line in remainder.splitlines():
-                    print(f"   [train:err] {line}")
-
-        sel.close()
-        proc.wait()
-        elapsed_total = time.time() - start
+        elapsed_total = time.monotonic() - start
         return (
             proc.returncode or 0,
-            "".join(stdout_lines),
-            "".join(stderr_lines),
+            stdout_sink.tail(),
+            stderr_sink.tail(),
             elapsed_total,
             timed_out,
         )
 
+    def _stream_process(
+        self,
+        proc: subprocess.Popen,
+        stdout_sink: "_OutputSink",
+        stderr_sink: "_OutputSink",
+        timeout_seconds: int,
+        heartbeat_seconds: int,
+        phase_label: str,
+        input_bytes: Optional[bytes] = None,
+        line_prefixes: Optional[tuple[str, str]] = None,
+    ) -> bool:
+        """Pump a process's pipes into sinks until it exits or times out.
+
+        Args:
+            proc: Process started with binary stdout/stderr pipes
+            stdout_sink: Destination for stdout bytes
+            stderr_sink: Destination for stderr bytes
+            timeout_seconds: Kill the process after this many seconds
+            heartbeat_seconds: Interval between progress lines
+            phase_label: Label used in progress lines
+            input_bytes: Data to feed to stdin, which is then closed
+            line_prefixes: When set, echo complete stdout/stderr lines with these prefixes
+
+        Returns:
+            True if the process was killed for exceeding the timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout_seconds
+        next_heartbeat = start + heartbeat_seconds
+        timed_out = False
+
+        sel = selectors.DefaultSelector()
+        partial_lines: dict[int, bytes] = {}
+        for index, (pipe, sink) in enumerate(
+            ((proc.stdout, stdout_sink), (proc.stderr, stderr_sink))
+        ):
+            if pipe is not None:
+                prefix = line_prefixes[index] if line_prefixes is not None else None
+                sel.register(pipe, selectors.EVENT_READ, (sink, prefix))
+                partial_lines[pipe.fileno()] = b""
+
+        input_view = memoryview(input_bytes or b"")
+        input_offset = 0
+        if proc.stdin is not None:
+            if input_view:
+                sel.register(proc.stdin, selectors.EVENT_WRITE)
+            else:
+                proc.stdin.close()
+
+        # On Linux a pidfd wakes the selector when the process exits, so output, exit and
+        # heartbeats are all handled by one select() call.
+        pidfd: Optional[int] = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(proc.pid)
+                sel.register(pidfd, selectors.EVENT_READ, _PROCESS_EXIT)
+            except OSError:
+                pidfd = None
+        exited = False
+
+        # The process runs in its own session, so a Ctrl-C, SIGTERM or hangup aimed at the
+        # orchestrator never reaches it; kill its group before propagating rather than leaving
+        # a training job orphaned.
+        previous_handlers: dict[int, Any] = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in _TERMINATION_SIGNALS:
+                if signal.getsignal(signum) is not signal.SIG_IGN:
+                    previous_handlers[signum] = signal.signal(signum, _exit_on_signal)
+        try:
+            try:
+                while sel.get_map():
+                    now = time.monotonic()
+                    if now >= deadline:
+                        timed_out = True
+                        _kill_process_group(proc)
+                        break
+
+                    if now >= next_heartbeat:
+                        print(
+                            f"   ... {phase_label} still running ({now - start:.0f}s / {timeout_seconds}s, pid={proc.pid})",
+                            flush=True,
+                        )
+                        next_heartbeat = now + heartbeat_seconds
+
+                    # Once the process has exited, only drain output that is already buffered.
+                    timeout = 0 if exited else min(deadline, next_heartbeat) - now
+                    if pidfd is None:
+                        # No exit notification: poll, or a background child still holding
+                        # the pipes would keep a finished process "running" until the deadline.
+                        timeout = min(timeout, 1.0)
+                    events = sel.select(timeout=timeout)
+                    if pidfd is None and not exited:
+                        exited = proc.poll() is not None
+                    if exited and not events:
+                        break
+
+                    for key, _ in events:
+                        if key.data is _PROCESS_EXIT:
+                            sel.unregister(key.fileobj)
+                            exited = True
+                            continue
+
+                        if key.fileobj is proc.stdin:
+                            try:
+                                input_offset += os.write(
+                                    key.fd,
+                                    input_view[input_offset : input_offset + select.PIPE_BUF],
+                                )
+                            except BrokenPipeError:
+                                input_offset = len(input_view)
+                            if input_offset >= len(input_view):
+                                sel.unregister(key.fileobj)
+                                key.fileobj.close()
+                            continue
+
+                        sink, prefix = key.data
+                        chunk = os.read(key.fd, 1 << 16)
+                        if chunk:
+                            sink.write(chunk)
+                        else:
+                            sel.unregister(key.fileobj)
+
+                        if prefix is not None:
+                            data = partial_lines[key.fd] + chunk
+                            # Hold back a trailing CR until the next read shows whether an LF
+                            # follows, so a CRLF split across reads stays one line end.
+                            held = b"\r" if chunk and data.endswith(b"\r") else b""
+                            lines = _LINE_END_RE.split(data[: len(data) - len(held)])
+                            pending = lines.pop() if chunk else b""
+                            if len(pending) > _MAX_PENDING_LINE:
+                                lines.append(pending)
+                                pending = b""
+                            partial_lines[key.fd] = pending + held
+                            echoed = [
+                                f"{prefix}{line.decode('utf-8', errors='replace').rstrip()}"
+                                for line in lines
+                                if chunk or line
+                            ]
+                            if echoed:
+                                print("\n".join(echoed), flush=True)
+            finally:
+                sel.close()
+                if pidfd is not None:
+                    os.close(pidfd)
+
+            while not timed_out:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    _kill_process_group(proc)
+                    break
+                try:
+                    proc.wait(timeout=min(heartbeat_seconds, remaining))
+                    break
+                except subprocess.TimeoutExpired:
+                    print(
+                        f"   ... {phase_label} still running ({time.monotonic() - start:.0f}s / {timeout_seconds}s, pid={proc.pid})",
+                        flush=True,
+                    )
+        except BaseException:
+            _kill_process_group(proc)
+            proc.wait()
+            raise
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        proc.wait()
+        for pipe in (proc.stdin, proc.stdout, proc.stderr):
+            if pipe is not None:
+                pipe.close()
+        return timed_out
+
     def run(self, prompt: str) -> None:
         """Run the Ralph ML Loop.
 
@@ -220,16 +735,19 @@ class Orchestrator:
         print(f"🦕 Ralph ML Loop - {self.config.project.name}")
         print(f"{'=' * 60}\n")
         print(f"Prompt: {prompt}")
+        print(f"Target: {self._target.name} {self._target_sym} {self._target.value}")
+        safeguards = self.config.safeguards
+        max_cycles = safeguards.max_cycles
         print(
-            f"Target: {self.config.project.target_metric.name} {self.config.project.target_metric.comparator_symbol()} {self.config.project.target_metric.value}"
+            f"Safeguards: max {max_cycles} cycles, {safeguards.time_limit_per_cycle_minutes}min per cycle\n",
+            flush=True,
         )
-        print(
-            f"Safeguards: max {self.config.safeguards.max_cycles} cycles, {self.config.safeguards.time_limit_per_cycle_minutes}min per cycle\n"
-        )
-        sys.stdout.flush()
 
         self.state.status = "running"
-        self.state.start_time = datetime.now().isoformat()
+        self.state.start_time = _now_iso()
+
+        # Capture only reads the workspace, so it overlaps with the Phase 2/3 subprocesses
+        capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ralph-capture")
 
         try:
             while True:
@@ -242,41 +760,51 @@ class Orchestrator:
                 print(f"\n{'─' * 60}")
                 print(f"🔄 CYCLE {cycle_num}")
                 print(f"{'─' * 60}\n")
-                sys.stdout.flush()
 
                 cycle_dir = self._get_cycle_dir(cycle_num)
+                cycle_timestamp = _now_iso()
 
                 # Phase 1: Code Generation
-                print("📝 Phase 1: Code Generation...")
-                sys.stdout.flush()
+                print("📝 Phase 1: Code Generation...", flush=True)
                 self._phase1_codegen(cycle_dir, prompt)
 
-                source_snapshot_dir = self._capture_source_snapshot(cycle_dir)
-                architecture_log = self._capture_architecture_log(cycle_dir)
+                # Phase 1 has exited, so its files are final; fingerprint them while training starts
+                capture_future = capture_pool.submit(
+                    self._capture_cycle_artifacts, cycle_dir, cycle_timestamp
+                )
 
                 # Phase 2: Training & Validation
-                print("\n🚀 Phase 2: Training & Validation...")
-                sys.stdout.flush()
+                print("\n🚀 Phase 2: Training & Validation...", flush=True)
                 metrics = self._phase2_training(cycle_dir)
+                architecture_log, source_snapshot_dir, capture_messages = capture_future.result()
+                print("\n".join(capture_messages))
 
-                best_model_artifact = self._capture_model_artifact(cycle_dir)
+                # Training has exited, so the model artifact is final; copy it during analysis
+                artifact_future = capture_pool.submit(self._capture_model_artifact, cycle_dir)
 
                 # Phase 3: Analysis
-                print("\n🔍 Phase 3: Analysis...")
-                sys.stdout.flush()
+                print("\n🔍 Phase 3: Analysis...", flush=True)
                 analysis = self._phase3_analysis(cycle_dir, metrics, prompt)
+                best_model_artifact = artifact_future.result()
 
-                # Create snapshot
-                snapshot = CycleSnapshot(
+                # Create snapshot; every field was just built by the orchestrator itself,
+                # so skip re-validating (and copying) the metrics, analysis and log payloads
+                snapshot = CycleSnapshot.model_construct(
                     cycle_number=cycle_num,
                     metrics=metrics,
                     analysis=analysis,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=cycle_timestamp,
                     architecture_log=architecture_log,
                     best_model_artifact=best_model_artifact,
                     source_snapshot_dir=source_snapshot_dir,
                 )
                 self.state.add_cycle(snapshot)
+                self._history_lines.append(
+                    self._format_history_line(*self.state.metric_history[-1])
+                )
+                if self.state.best_cycle == snapshot.cycle_number:
+                    self._best_snapshot = snapshot
+                self._save_cycle_snapshot(snapshot)
                 self._save_state()
                 self._write_best_model_index()
 
@@ -289,50 +817,49 @@ class Orchestrator:
                     break
 
                 # Check max cycles
-                if cycle_num >= self.config.safeguards.max_cycles:
-                    print(f"\n⚠️  Max cycles ({self.config.safeguards.max_cycles}) reached")
+                if cycle_num >= max_cycles:
+                    print(f"\n⚠️  Max cycles ({max_cycles}) reached")
                     break
 
         finally:
+            capture_pool.shutdown(wait=True)
             self.state.status = "completed"
-            self.state.last_update = datetime.now().isoformat()
+            self.state.last_update = _now_iso()
             self._save_state()
-            self._write_best_model_index()
+            self._write_best_model_index(updated_at=self.state.last_update)
             self._print_final_summary()
 
     def _should_stop(self) -> bool:
         """Check if we should stop before starting a cycle."""
         # Check no-improvement stop
-        if len(self.state.history) >= self.config.safeguards.no_improvement_stop_cycles:
-            recent_cycles = self.state.history[-self.config.safeguards.no_improvement_stop_cycles :]
-            values = []
-            for snapshot in recent_cycles:
-                value = snapshot.metrics.result.model_dump().get(snapshot.metrics.target.name)
-                if isinstance(value, (int, float)):
-                    values.append(float(value))
-
-            if len(values) == len(recent_cycles):
-                direction = self.config.project.target_metric.get_direction()
-                min_delta = self.config.safeguards.min_improvement_delta
-                deltas = []
-                for idx in range(1, len(values)):
-                    if direction == "minimize":
-                        deltas.append(values[idx - 1] - values[idx])
-                    else:
-                        deltas.append(values[idx] - values[idx - 1])
-
-                if deltas and all(delta < min_delta for delta in deltas):
-                    print(
-                        f"\n⚠️  No significant improvement (delta < {min_delta}) for {self.config.safeguards.no_improvement_stop_cycles} cycles"
-                    )
-                    return True
+        safeguards = self.config.safeguards
+        window = safeguards.no_improvement_stop_cycles
+        if len(self.state.history) < window:
+            return False
+
+        recent_cycles = self.state.metric_history[-window:]
+        values = [value for _, value in recent_cycles if value is not None]
+
+        if len(values) == len(recent_cycles):
+            min_delta = safeguards.min_improvement_delta
+            # Improvement of each cycle over the one before it, newest pair first, since a
+            # recent gain is the likeliest; all() stops at the first real gain
+            pairs = zip(reversed(values[:-1]), reversed(values[1:]))
+            if self._target_dir == "minimize":
+                deltas = (prev - cur for prev, cur in pairs)
+            else:
+                deltas = (cur - prev for prev, cur in pairs)
 
-            elif values and all(v == values[0] for v in values):
+            if len(values) > 1 and all(delta < min_delta for delta in deltas):
                 print(
-                    f"\n⚠️  No improvement for {self.config.safeguards.no_improvement_stop_cycles} cycles"
+                    f"\n⚠️  No significant improvement (delta < {min_delta}) for {window} cycles"
                 )
                 return True
 
+        elif values and all(v == values[0] for v in values):
+            print(f"\n⚠️  No improvement for {window} cycles")
+            return True
+
         return False
 
     def _phase1_codegen(self, cycle_dir: Path, prompt: str) -> None:
@@ -346,36 +873,13 @@ class Orchestrator:
 
         cycle_num = self.state.current_cycle + 1
 
-        opencode_prompt = f"""Create or modify a training codebase for this task.
-
-User Request: {prompt}
-Cycle: {cycle_num}
-
-Context from previous cycles:
-{context}
-
-Requirements:
-1. Create a complete, runnable training setup
-2. Include: model.py, train.py, eval.py, data.py, config.json
-3. Use data from: {self.config.data.root}
-4. Target: {self.config.project.target_metric.name} {self.config.project.target_metric.comparator_symbol()} {self.config.project.target_metric.value}
-5. Framework: {self.config.project.framework}
-6. Make it deterministic where possible (seeds)
-7. Output metrics to metrics.json after training
-8. If files already exist, update them in place and keep working parts
-9. Do not rewrite from scratch unless files are missing or broken
-10. Training observability is required:
-    - show live progress with tqdm in train.py
-    - print a clear epoch summary line (epoch, train_loss, val_loss, val_acc, test_acc) every epoch
-    - ensure logs flush so progress is visible in real time in non-interactive terminals
-11. Do not execute training/evaluation commands in this phase.
-    - Do not run python train.py, python eval.py, pytest, or any long-running experiments.
-    - Only create/update source files in this phase.
-
-Write the code files directly."""
+        opencode_prompt = PHASE1_PROMPT_TEMPLATE.format_map(
+            {**self._prompt_fields, "prompt": prompt, "cycle_num": cycle_num, "context": context}
+        )
 
-        workspace_path = self.config.get_paths()["workspace"].resolve()
-        (cycle_dir / "phase1_prompt.txt").write_text(opencode_prompt)
+        workspace_path = self._workspace_path
+        prompt_bytes = opencode_prompt.encode("utf-8")
+        _write_bytes(cycle_dir / "phase1_prompt.txt", prompt_bytes)
 
         print(f"   Running OpenCode code generation...")
         print(f"   Prompt: Create training codebase for {prompt[:50]}...")
@@ -387,27 +891,24 @@ Write the code files directly."""
         )
 
         returncode, stdout, stderr, elapsed, timed_out = self._run_with_heartbeat(
-            command=[self.opencode_path, "run"],
+            command=self._opencode_cmd,
             cwd=workspace_path,
-            timeout_seconds=self.config.safeguards.time_limit_per_cycle_minutes * 60,
+            timeout_seconds=self._timeout_seconds,
             phase_label="Phase 1 code generation",
-            input_text=opencode_prompt,
+            stdout_path=cycle_dir / "phase1_opencode_output.txt",
+            stderr_path=cycle_dir / "phase1_opencode_errors.txt",
+            input_bytes=prompt_bytes,
         )
 
-        # Save output
-        (cycle_dir / "phase1_opencode_output.txt").write_text(stdout)
-        if stderr:
-            (cycle_dir / "phase1_opencode_errors.txt").write_text(stderr)
-
         if timed_out:
             print("   ! Code generation timed out")
         elif returncode != 0:
             print(f"   ! Code generation failed (exit {returncode})")
             if stderr:
-                print(f"   Error: {stderr[:300]}")
+                print(f"   Error: {stderr[-300:]}")
         else:
             print(f"   ✓ Code generation complete ({elapsed:.1f}s)")
-            print(f"   Output: {stdout[:200] if stdout else 'No output'}")
+            print(f"   Output: {stdout[-200:] if stdout else 'No output'}")
 
     def _phase2_training(self, cycle_dir: Path) -> MetricsResult:
         """Phase 2: Training execution.
@@ -420,7 +921,7 @@ Write the code files directly."""
         """
         # Run training
         train_cmd = self.config.execution.train_cmd.split()
-        workspace = self.config.get_paths()["workspace"]
+        workspace = self._workspace
         self._ensure_workspace_data_access(workspace)
 
         # Remove stale metrics produced outside Phase 2
@@ -430,38 +931,42 @@ Write the code files directly."""
             print(f"   Removed stale metrics before training: {stale_metrics}")
 
         print(f"   Command: {' '.join(train_cmd)}")
-        print(f"   Workspace: {workspace.resolve()}")
+        print(f"   Workspace: {self._workspace_path}")
         print(
             f"   Logs: {cycle_dir / 'training_stdout.txt'} and {cycle_dir / 'training_stderr.txt'}"
         )
 
-        returncode, train_stdout, train_stderr, train_seconds, timed_out = (
-            self._run_training_with_live_logs(
-                command=train_cmd,
-                cwd=workspace,
-                timeout_seconds=self.config.safeguards.time_limit_per_cycle_minutes * 60,
-            )
+        stdout_path = cycle_dir / "training_stdout.txt"
+        returncode, _, train_stderr, train_seconds, timed_out = self._run_training_with_live_logs(
+            command=train_cmd,
+            cwd=workspace,
+            timeout_seconds=self._timeout_seconds,
+            stdout_path=stdout_path,
+            stderr_path=cycle_dir / "training_stderr.txt",
         )
 
-        # Save logs
-        (cycle_dir / "training_stdout.txt").write_text(train_stdout)
-        if train_stderr:
-            (cycle_dir / "training_stderr.txt").write_text(train_stderr)
-
         if timed_out:
             print("   ! Training timed out")
         elif returncode != 0:
             print(f"   ! Training exited with code {returncode}")
             if train_stderr:
-                print(f"   Error: {train_stderr[:300]}")
+                print(f"   Error: {train_stderr[-300:]}")
         else:
             print(f"   ✓ Training finished ({train_seconds:.1f}s)")
 
         # Load metrics if available
         metrics_path = workspace / "metrics.json"
-        if metrics_path.exists():
-            with open(metrics_path) as f:
-                metrics_data = json.load(f)
+        try:
+            metrics_bytes: Optional[bytes] = metrics_path.read_bytes()
+        except FileNotFoundError:
+            metrics_bytes = None
+        if metrics_bytes is not None:
+            try:
+                metrics_data = orjson.loads(metrics_bytes)
+            except orjson.JSONDecodeError:
+                # Training scripts may emit NaN/Infinity (e.g. a diverged loss), which
+                # only the stdlib parser accepts.
+                metrics_data = json.loads(metrics_bytes)
 
             # Support both formats:
             # 1) {"result": {"test_accuracy": ...}}
@@ -500,7 +1005,7 @@ Write the code files directly."""
             if val_accuracy is None and isinstance(final_epoch, dict):
                 val_accuracy = final_epoch.get("val_accuracy")
 
-            target_name = self.config.project.target_metric.name
+            target_name = self._target.name
             target_value = result_source.get(target_name)
             if target_value is None and isinstance(final_epoch, dict):
                 target_value = final_epoch.get(target_name)
@@ -519,23 +1024,23 @@ Write the code files directly."""
 
             metrics = MetricsResult(
                 cycle=self.state.current_cycle + 1,
-                target=self.config.project.target_metric,
+                target=self._target,
                 result=MetricsResult.ResultMetrics(**result_payload),
                 runtime=MetricsResult.Runtime(train_seconds=train_seconds),
             )
 
-            parsed_target = metrics.result.model_dump().get(self.config.project.target_metric.name)
+            parsed_target = metrics.get_target_value()
             print(
-                f"   Parsed metrics from {metrics_path}: {self.config.project.target_metric.name}={parsed_target}"
+                f"   Parsed metrics from {metrics_path}: {self._target.name}={parsed_target}"
             )
         else:
             # Parse from output if no metrics.json
-            metrics = self._parse_metrics_from_output(train_stdout)
+            metrics = self._parse_metrics_from_output(_iter_lines_reversed(stdout_path))
             metrics.cycle = self.state.current_cycle + 1
             metrics.runtime.train_seconds = train_seconds
 
         # Save metrics to cycle dir
-        (cycle_dir / "metrics.json").write_text(metrics.model_dump_json(indent=2))
+        _write_json(cycle_dir / "metrics.json", metrics, atomic=True)
 
         return metrics
 
@@ -556,9 +1061,10 @@ Write the code files directly."""
             workspace_data.symlink_to(data_root, target_is_directory=True)
             print(f"   Linked workspace data: {workspace_data} -> {data_root}")
         except OSError:
-            # Fallback for environments where symlinks are restricted.
-            shutil.copytree(data_root, workspace_data)
-            print(f"   Copied dataset into workspace: {workspace_data}")
+            # Fallback for environments where symlinks are restricted. Files are
+            # hardlinked where possible, so the dataset is not duplicated on disk.
+            shutil.copytree(data_root, workspace_data, copy_function=_link_or_copy)
+            print(f"   Mirrored dataset into workspace: {workspace_data}")
 
     def _phase3_analysis(
         self, cycle_dir: Path, metrics: MetricsResult, prompt: str
@@ -573,31 +1079,26 @@ Write the code files directly."""
         Returns:
             Cycle analysis
         """
-        # Load context
-        context = self._build_analysis_context(metrics)
-
-        analysis_prompt = f"""Analyze the training results and recommend improvements.
-
-Original Request: {prompt}
-Target: {metrics.target.name} {metrics.target.comparator_symbol()} {metrics.target.value}
-Achieved: {metrics.result.model_dump().get(metrics.target.name, "N/A")}
-
-Context:
-{context}
-
-Tasks:
-1. Analyze what went well and what didn't
-2. Identify specific improvements (architecture, hyperparameters, data, etc.)
-3. Rank recommendations by confidence (high/medium/low)
-4. Decide if we should continue or stop
+        # Dump the result metrics once and reuse the dict for the prompt and the fallbacks
+        result_dict = metrics.result.model_dump()
+        target = metrics.target
+        target_value = result_dict.get(target.name)
 
-Output format:
-analysis.md with summary
-recommendations.json with list of recommendations
-decision.json with action (continue/stop) and rationale"""
+        # Load context
+        context = self._build_analysis_context(result_dict)
+
+        analysis_prompt = PHASE3_PROMPT_TEMPLATE.format_map(
+            {
+                **self._prompt_fields,
+                "prompt": prompt,
+                "achieved": result_dict.get(target.name, "N/A"),
+                "context": context,
+            }
+        )
 
-        workspace_path = self.config.get_paths()["workspace"].resolve()
-        (cycle_dir / "phase3_prompt.txt").write_text(analysis_prompt)
+        workspace_path = self._workspace_path
+        prompt_bytes = analysis_prompt.encode("utf-8")
+        _write_bytes(cycle_dir / "phase3_prompt.txt", prompt_bytes)
 
         print(f"   Running OpenCode analysis...")
         print(f"   Workspace: {workspace_path}")
@@ -608,73 +1109,69 @@ decision.json with action (continue/stop) and rationale"""
         )
 
         returncode, stdout, stderr, elapsed, timed_out = self._run_with_heartbeat(
-            command=[self.opencode_path, "run"],
+            command=self._opencode_cmd,
             cwd=workspace_path,
-            timeout_seconds=self.config.safeguards.time_limit_per_cycle_minutes * 60,
+            timeout_seconds=self._timeout_seconds,
             phase_label="Phase 3 analysis",
-            input_text=analysis_prompt,
+            stdout_path=cycle_dir / "phase3_opencode_output.txt",
+            stderr_path=cycle_dir / "phase3_opencode_errors.txt",
+            input_bytes=prompt_bytes,
         )
 
-        # Save output
-        (cycle_dir / "phase3_opencode_output.txt").write_text(stdout)
-        if stderr:
-            (cycle_dir / "phase3_opencode_errors.txt").write_text(stderr)
-
         if timed_out:
             print("   ! Analysis timed out")
         elif returncode != 0:
             print(f"   ! Analysis exited with code {returncode}")
             if stderr:
-                print(f"   Error: {stderr[:300]}")
+                print(f"   Error: {stderr[-300:]}")
         else:
             print(f"   ✓ Analysis completed ({elapsed:.1f}s)")
 
         # Build analysis from files generated by analysis phase, with safe fallbacks
-        result_dict = metrics.result.model_dump()
-        target_value = result_dict.get(metrics.target.name, None)
-        target_met = isinstance(target_value, (int, float)) and metrics.target.target_is_met(
+        target_met = isinstance(target_value, (int, float)) and target.target_is_met(
             float(target_value)
         )
         target_display = f"{target_value:.4f}" if isinstance(target_value, (int, float)) else "N/A"
 
-        workspace = self.config.get_paths()["workspace"]
+        workspace = self._workspace
         analysis_md_path = workspace / "analysis.md"
         recommendations_path = workspace / "recommendations.json"
         decision_path = workspace / "decision.json"
 
         summary = (
-            f"Training achieved {metrics.target.name}={target_display}. "
-            f"Target: {self.config.project.target_metric.comparator_symbol()} {self.config.project.target_metric.value:.4f}"
+            f"Training achieved {target.name}={target_display}. "
+            f"Target: {self._target_sym} {self._target.value:.4f}"
         )
-        if analysis_md_path.exists():
-            analysis_md = analysis_md_path.read_text().strip()
-            if analysis_md:
-                summary = analysis_md
+        try:
+            analysis_md = analysis_md_path.read_bytes().decode("utf-8", errors="replace").strip()
+        except FileNotFoundError:
+            analysis_md = ""
+        if analysis_md:
+            summary = analysis_md
 
         recommendations: list[Recommendation] = []
-        if recommendations_path.exists():
-            try:
-                with open(recommendations_path) as f:
-                    recommendations_data = json.load(f)
+        # A missing file raises inside the try and falls through to the defaults
+        try:
+            recommendations_data = orjson.loads(recommendations_path.read_bytes())
 
-                if isinstance(recommendations_data, dict):
-                    raw_recommendations = recommendations_data.get("recommendations", [])
-                elif isinstance(recommendations_data, list):
-                    raw_recommendations = recommendations_data
-                else:
-                    raw_recommendations = []
-
-                for item in raw_recommendations:
-                    if isinstance(item, dict):
-                        recommendations.append(
-                            Recommendation(
-                                action=str(item.get("action", "Analyze and iterate")),
-                                confidence=str(item.get("confidence", "medium")),
-                                rationale=str(item.get("rationale", "No rationale provided")),
-                            )
+            if isinstance(recommendations_data, dict):
+                raw_recommendations = recommendations_data.get("recommendations", [])
+            elif isinstance(recommendations_data, list):
+                raw_recommendations = recommendations_data
+            else:
+                raw_recommendations = []
+
+            for item in raw_recommendations:
+                if isinstance(item, dict):
+                    recommendations.append(
+                        Recommendation(
+                            action=str(item.get("action", "Analyze and iterate")),
+                            confidence=str(item.get("confidence", "medium")),
+                            rationale=str(item.get("rationale", "No rationale provided")),
                         )
-            except Exception:
-                recommendations = []
+                    )
+        except Exception:
+            recommendations = []
 
         if not recommendations:
             recommendations = [
@@ -692,25 +1189,23 @@ decision.json with action (continue/stop) and rationale"""
             else "Continue improving toward optimization objective"
         )
 
-        if decision_path.exists():
-            try:
-                with open(decision_path) as f:
-                    decision_data = json.load(f)
-
-                if (
-                    isinstance(decision_data, dict)
-                    and "decision" in decision_data
-                    and isinstance(decision_data["decision"], dict)
-                ):
-                    decision_data = decision_data["decision"]
-
-                if isinstance(decision_data, dict):
-                    parsed_action = str(decision_data.get("action", decision_action)).lower()
-                    if parsed_action in {"continue", "stop"}:
-                        decision_action = parsed_action
-                    decision_rationale = str(decision_data.get("rationale", decision_rationale))
-            except Exception:
-                pass
+        try:
+            decision_data = orjson.loads(decision_path.read_bytes())
+
+            if (
+                isinstance(decision_data, dict)
+                and "decision" in decision_data
+                and isinstance(decision_data["decision"], dict)
+            ):
+                decision_data = decision_data["decision"]
+
+            if isinstance(decision_data, dict):
+                parsed_action = str(decision_data.get("action", decision_action)).lower()
+                if parsed_action in {"continue", "stop"}:
+                    decision_action = parsed_action
+                decision_rationale = str(decision_data.get("rationale", decision_rationale))
+        except Exception:
+            pass
 
         analysis = CycleAnalysis(
             summary=summary,
@@ -722,8 +1217,8 @@ decision.json with action (continue/stop) and rationale"""
         )
 
         # Save analysis
-        (cycle_dir / "analysis.json").write_text(analysis.model_dump_json(indent=2))
-        (cycle_dir / "analysis.md").write_text(analysis.summary)
+        _write_json(cycle_dir / "analysis.json", analysis, atomic=True)
+        _write_bytes(cycle_dir / "analysis.md", analysis.summary.encode("utf-8"))
 
         return analysis
 
@@ -736,179 +1231,259 @@ decision.json with action (continue/stop) and rationale"""
         prev_snapshot = self.state.history[-1]
         prev_analysis = prev_snapshot.analysis
 
-        context = f"""
-Previous cycle ({prev_snapshot.cycle_number}) results:
-- Metrics: {prev_snapshot.metrics.result.model_dump()}
-- Analysis: {prev_analysis.summary}
-- Recommendations: {[{"action": r.action, "confidence": r.confidence, "rationale": r.rationale} for r in prev_analysis.recommendations]}
-{f"- Architecture changes: {prev_snapshot.architecture_log.get('changed_files', [])}" if prev_snapshot.architecture_log else ""}
+        recommendations = [
+            {"action": r.action, "confidence": r.confidence, "rationale": r.rationale}
+            for r in prev_analysis.recommendations
+        ]
+        arch_log = prev_snapshot.architecture_log
+        changes_line = (
+            f"- Architecture changes: {arch_log.get('changed_files', [])}" if arch_log else ""
+        )
 
-Apply the recommendations from the previous cycle.
-"""
-        return context
+        return "\n".join(
+            [
+                "",
+                f"Previous cycle ({prev_snapshot.cycle_number}) results:",
+                f"- Metrics: {prev_snapshot.metrics.result.model_dump()}",
+                f"- Analysis: {prev_analysis.summary}",
+                f"- Recommendations: {recommendations}",
+                changes_line,
+                "",
+                "Apply the recommendations from the previous cycle.",
+                "",
+            ]
+        )
 
-    def _build_analysis_context(self, metrics: MetricsResult) -> str:
-        """Build context for analysis phase."""
-        if not self.state.history:
-            return "First cycle - baseline analysis."
+    def _format_history_line(self, cycle_number: int, value: Optional[float]) -> str:
+        """Format one entry of the metrics timeline."""
+        return f"Cycle {cycle_number}: {self._target.name}={value if value is not None else 'N/A'}"
 
-        # Build metrics history
-        history_lines = []
-        for snapshot in self.state.history:
-            value = snapshot.metrics.result.model_dump().get(snapshot.metrics.target.name, "N/A")
-            history_lines.append(
-                f"Cycle {snapshot.cycle_number}: {snapshot.metrics.target.name}={value}"
-            )
+    def _build_analysis_context(self, result_dict: dict[str, Any]) -> str:
+        """Build context for analysis phase from the current cycle's dumped result metrics."""
+        if not self.state.metric_history:
+            return "First cycle - baseline analysis."
 
-        history_str = "\n".join(history_lines)
+        history_str = "\n".join(self._history_lines)
 
         return f"""
 Metrics history:
 {history_str}
 
 Current cycle metrics:
-{metrics.result.model_dump()}
+{result_dict}
 
-Objective: {self.config.project.target_metric.get_direction()} {self.config.project.target_metric.name}
+Objective: {self._target_dir} {self._target.name}
 Best achieved: {self.state.best_metric} (Cycle {self.state.best_cycle})
 """
 
-    def _parse_metrics_from_output(self, output: str) -> MetricsResult:
-        """Parse metrics from training output."""
+    def _parse_metrics_from_output(self, lines_newest_first: Iterable[str]) -> MetricsResult:
+        """Parse metrics from training output, given its lines from last to first.
+
+        The last reported value of each metric wins, so the scan stops as soon as
+        every metric it looks for has been seen.
+        """
         # Simple parsing - in real implementation would be more robust
         metrics = MetricsResult(
             cycle=0,
-            target=self.config.project.target_metric,
+            target=self._target,
         )
 
         # Try to find accuracy in output
-        for line in output.split("\n"):
-            target_name = self.config.project.target_metric.name.lower()
-            if target_name in line.lower():
-                try:
-                    import re
-
-                    numbers = re.findall(r"[0-9]+(?:\.[0-9]+)?", line)
-                    if numbers:
-                        setattr(
-                            metrics.result,
-                            self.config.project.target_metric.name,
-                            float(numbers[-1]),
-                        )
-                except Exception:
-                    pass
-
-            if "test_accuracy" in line.lower() or "test accuracy" in line.lower():
-                try:
-                    # Extract number
-                    import re
-
-                    match = re.search(r"[0-9.]+", line)
-                    if match:
-                        metrics.result.test_accuracy = float(match.group())
-                except Exception:
-                    pass
-            elif "val_accuracy" in line.lower() or "val accuracy" in line.lower():
-                try:
-                    import re
-
-                    match = re.search(r"[0-9.]+", line)
-                    if match:
-                        metrics.result.val_accuracy = float(match.group())
-                except Exception:
-                    pass
+        target_name = self._target.name
+        target_key = target_name.lower()
+        wanted = {target_name, "test_accuracy", "val_accuracy"}
+        found: dict[str, float] = {}
+        for line in lines_newest_first:
+            # Every value pattern needs a digit, so most banner and traceback lines stop here
+            if not _HAS_DIGIT(line):
+                continue
+            lowered = line.lower()
+            # Values this line reports, in the order a forward scan would apply them
+            updates: list[tuple[str, float]] = []
+            if target_key in lowered:
+                numbers = _NUMBER_RE.findall(line)
+                if numbers:
+                    updates.append((target_name, float(numbers[-1])))
+
+            field = None
+            if "test_accuracy" in lowered or "test accuracy" in lowered:
+                field = "test_accuracy"
+            elif "val_accuracy" in lowered or "val accuracy" in lowered:
+                field = "val_accuracy"
+
+            if field is not None:
+                match = _LEADING_NUMBER_RE.search(line)
+                if match:
+                    try:
+                        updates.append((field, float(match.group())))
+                    except ValueError:
+                        # A bare "." matches the pattern but is not a number
+                        pass
+
+            for name, value in reversed(updates):
+                found.setdefault(name, value)
+            if len(found) == len(wanted):
+                break
 
+        for name, value in found.items():
+            setattr(metrics.result, name, value)
         return metrics
 
     def _print_cycle_results(self, snapshot: CycleSnapshot) -> None:
         """Print results of a cycle."""
-        target_name = snapshot.metrics.target.name
-        target_value = snapshot.metrics.result.model_dump().get(target_name, "N/A")
-
-        print(f"\n📊 Cycle {snapshot.cycle_number} Results:")
-        print(f"   {target_name}: {target_value}")
-        print(
-            f"   Target: {snapshot.metrics.target.comparator_symbol()} {snapshot.metrics.target.value}"
-        )
-        print(f"   Training time: {snapshot.metrics.runtime.train_seconds:.1f}s")
+        target = snapshot.metrics.target
+        target_name = target.name
+        target_value = snapshot.metrics.get_target_value()
+
+        lines = [
+            f"\n📊 Cycle {snapshot.cycle_number} Results:",
+            f"   {target_name}: {target_value if target_value is not None else 'N/A'}",
+            f"   Target: {self._target_sym} {target.value}",
+            f"   Training time: {snapshot.metrics.runtime.train_seconds:.1f}s",
+        ]
 
         if isinstance(target_value, (int, float)):
-            met = snapshot.metrics.target.target_is_met(float(target_value))
-            print(f"   Target met: {'yes' if met else 'no'}")
+            met = target.target_is_met(float(target_value))
+            lines.append(f"   Target met: {'yes' if met else 'no'}")
 
         if snapshot.architecture_log:
-            print(f"   Architecture changes: {snapshot.architecture_log.get('changed_files', [])}")
+            lines.append(
+                f"   Architecture changes: {snapshot.architecture_log.get('changed_files', [])}"
+            )
 
         if snapshot.best_model_artifact:
-            print(f"   Model artifact: {snapshot.best_model_artifact}")
+            lines.append(f"   Model artifact: {snapshot.best_model_artifact}")
 
         if snapshot.analysis:
-            print(f"\n💡 Analysis:")
-            print(f"   {snapshot.analysis.summary}")
+            lines.append("\n💡 Analysis:")
+            lines.append(f"   {snapshot.analysis.summary}")
             for rec in snapshot.analysis.recommendations[:2]:  # Show top 2
-                print(f"   - {rec.action} ({rec.confidence})")
+                lines.append(f"   - {rec.action} ({rec.confidence})")
+
+        print("\n".join(lines), flush=True)
 
     def _print_final_summary(self) -> None:
         """Print final summary."""
-        print(f"\n{'=' * 60}")
-        print(f"🏁 Ralph ML Loop Complete")
-        print(f"{'=' * 60}\n")
+        lines = [
+            f"\n{'=' * 60}",
+            "🏁 Ralph ML Loop Complete",
+            f"{'=' * 60}\n",
+            f"Total cycles: {self.state.current_cycle}",
+        ]
 
-        print(f"Total cycles: {self.state.current_cycle}")
         if self.state.best_metric is None:
-            print("Best metric: N/A")
+            lines.append("Best metric: N/A")
         else:
-            print(f"Best metric: {self.state.best_metric:.4f} (Cycle {self.state.best_cycle})")
-        print(
-            f"Target: {self.config.project.target_metric.name} {self.config.project.target_metric.comparator_symbol()} {self.config.project.target_metric.value}"
+            lines.append(f"Best metric: {self.state.best_metric:.4f} (Cycle {self.state.best_cycle})")
+        lines.append(
+            f"Target: {self._target.name} {self._target_sym} {self._target.value}"
         )
 
-        if self.state.best_cycle > 0 and len(self.state.history) >= self.state.best_cycle:
-            best_snapshot = self.state.history[self.state.best_cycle - 1]
+        best_snapshot = self._best_snapshot
+        if best_snapshot is not None:
             if best_snapshot.best_model_artifact:
-                print(f"Best model artifact: {best_snapshot.best_model_artifact}")
+                lines.append(f"Best model artifact: {best_snapshot.best_model_artifact}")
             if best_snapshot.architecture_log:
                 arch_path = best_snapshot.architecture_log.get("log_path")
                 if arch_path:
-                    print(f"Best architecture log: {arch_path}")
+                    lines.append(f"Best architecture log: {arch_path}")
             if best_snapshot.source_snapshot_dir:
-                print(f"Best source snapshot: {best_snapshot.source_snapshot_dir}")
+                lines.append(f"Best source snapshot: {best_snapshot.source_snapshot_dir}")
 
-        if self.state.history:
-            print(f"\n📈 Metrics Timeline:")
-            for snapshot in self.state.history:
-                target_name = snapshot.metrics.target.name
-                value = snapshot.metrics.result.model_dump().get(target_name, "N/A")
-                print(f"   Cycle {snapshot.cycle_number}: {target_name}={value}")
+        if self._history_lines:
+            lines.append("\n📈 Metrics Timeline:")
+            lines.extend(f"   {line}" for line in self._history_lines)
+
+        lines.append(f"\n📁 Artifacts: {self._runs_dir}")
+        lines.append(f"📊 State: {self.state_path}")
+
+        print("\n".join(lines), flush=True)
+
+    def _capture_cycle_artifacts(
+        self, cycle_dir: Path, timestamp: str
+    ) -> tuple[dict[str, Any], str, list[str]]:
+        """Fingerprint and snapshot tracked source files in a single pass.
+
+        Each tracked file is read once: its bytes feed the SHA-256 digest and are
+        written to the cycle's source snapshot at the same time.
 
-        print(f"\n📁 Artifacts: {self.config.get_paths()['runs']}")
-        print(f"📊 State: {self.state_path}")
+        Args:
+            cycle_dir: Directory for this cycle
+            timestamp: Cycle timestamp recorded in the manifest and architecture log
 
-    def _capture_architecture_log(self, cycle_dir: Path) -> dict[str, Any]:
-        """Capture architecture-relevant file fingerprints for this cycle."""
-        workspace = self.config.get_paths()["workspace"]
-        tracked_files = ["model.py", "train.py", "eval.py", "data.py", "config.json"]
+        Runs on the capture worker while training echoes its output, so progress lines are
+        returned for the caller to print instead of being printed here.
+
+        Returns:
+            Tuple of (architecture log, source snapshot directory, progress lines)
+        """
+        workspace = self._workspace
+        snapshot_dir = cycle_dir / "source_snapshot"
+        self._ensure_dir(snapshot_dir)
 
         previous_hashes: dict[str, str] = {}
+        # (bytes, mtime_ns) -> (sha256, line_count) from the previous cycle, to skip re-hashing
+        previous_stats: dict[str, tuple[tuple[int, int], tuple[str, int]]] = {}
+        prev_snapshot_dir: Optional[Path] = None
         if self.state.history:
+            if self.state.history[-1].source_snapshot_dir:
+                prev_snapshot_dir = Path(self.state.history[-1].source_snapshot_dir)
             prev_arch = self.state.history[-1].architecture_log or {}
             prev_files = prev_arch.get("files", {}) if isinstance(prev_arch, dict) else {}
             for file_name, info in prev_files.items():
                 if isinstance(info, dict) and isinstance(info.get("sha256"), str):
                     previous_hashes[file_name] = info["sha256"]
+                    if isinstance(info.get("mtime_ns"), int):
+                        previous_stats[file_name] = (
+                            (info.get("bytes"), info["mtime_ns"]),
+                            (info["sha256"], info.get("line_count")),
+                        )
 
         files_payload: dict[str, Any] = {}
         changed_files: list[str] = []
+        copied: list[str] = []
 
-        for rel_path in tracked_files:
+        for rel_path in TRACKED_FILES:
             full_path = workspace / rel_path
-            if not full_path.exists():
+            try:
+                st = full_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 files_payload[rel_path] = {"exists": False}
                 continue
 
-            content = full_path.read_text(errors="ignore")
-            digest = sha256(content.encode("utf-8")).hexdigest()
-            line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+            target_path = snapshot_dir / rel_path
+            self._ensure_dir(target_path.parent)
+            # A re-run of this cycle after a crash can find a hardlink into the previous
+            # cycle's snapshot here; writing through it would rewrite that archived copy.
+            try:
+                os.unlink(target_path)
+            except FileNotFoundError:
+                pass
+
+            cached = previous_stats.get(rel_path)
+            if cached is not None and cached[0] == (st.st_size, st.st_mtime_ns):
+                (digest, line_count), size = cached[1], st.st_size
+                # Snapshots are never modified after capture, so an unchanged file can
+                # share the previous cycle's inode. The workspace copy itself is never
+                # linked: Phase 1 may rewrite it in place.
+                linked = False
+                if prev_snapshot_dir is not None:
+                    try:
+                        os.link(prev_snapshot_dir / rel_path, target_path)
+                        linked = True
+                    except OSError:
+                        pass
+                if not linked:
+                    shutil.copyfile(full_path, target_path)
+                    os.utime(target_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            else:
+                digest, line_count, size = _hash_file(
+                    full_path, copy_to=target_path, buffer=self._hash_buf
+                )
+                os.utime(target_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            copied.append(rel_path)
 
             previous_digest = previous_hashes.get(rel_path)
             changed = previous_digest is None or previous_digest != digest
@@ -919,17 +1494,26 @@ Best achieved: {self.state.best_metric} (Cycle {self.state.best_cycle})
                 "exists": True,
                 "sha256": digest,
                 "line_count": line_count,
-                "bytes": full_path.stat().st_size,
+                "bytes": size,
+                "mtime_ns": st.st_mtime_ns,
                 "changed_since_prev_cycle": changed,
             }
 
+        manifest = {
+            "cycle": self.state.current_cycle + 1,
+            "timestamp": timestamp,
+            "files": copied,
+        }
+        _write_json(snapshot_dir / "manifest.json", manifest, atomic=True)
+        messages = [f"   Source snapshot saved: {snapshot_dir} (files: {copied or ['none']})"]
+
         arch_log = {
             "cycle": self.state.current_cycle + 1,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "objective": {
-                "name": self.config.project.target_metric.name,
-                "target_value": self.config.project.target_metric.value,
-                "direction": self.config.project.target_metric.get_direction(),
+                "name": self._target.name,
+                "target_value": self._target.value,
+                "direction": self._target_dir,
             },
             "changed_files": changed_files,
             "files": files_payload,
@@ -937,73 +1521,103 @@ Best achieved: {self.state.best_metric} (Cycle {self.state.best_cycle})
 
         arch_log_path = cycle_dir / "architecture_log.json"
         arch_log["log_path"] = str(arch_log_path)
-        arch_log_path.write_text(json.dumps(arch_log, indent=2))
+        _write_json(arch_log_path, arch_log, atomic=True)
 
-        print(
-            f"   Architecture log captured: {arch_log_path} (changed files: {changed_files or ['none']})"
+        messages.append(
+            f"   Architecture log captured: {arch_log_path} "
+            f"(changed files: {changed_files or ['none']})"
         )
-        return arch_log
-
-    def _capture_source_snapshot(self, cycle_dir: Path) -> str:
-        """Copy cycle source files so any cycle can be fully restored later."""
-        workspace = self.config.get_paths()["workspace"]
-        tracked_files = ["model.py", "train.py", "eval.py", "data.py", "config.json"]
-        snapshot_dir = cycle_dir / "source_snapshot"
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-
-        copied: list[str] = []
-        for rel_path in tracked_files:
-            source_path = workspace / rel_path
-            if not source_path.exists() or not source_path.is_file():
-                continue
-
-            target_path = snapshot_dir / rel_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, target_path)
-            copied.append(rel_path)
-
-        manifest = {
-            "cycle": self.state.current_cycle + 1,
-            "timestamp": datetime.now().isoformat(),
-            "files": copied,
-        }
-        (snapshot_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-        print(f"   Source snapshot saved: {snapshot_dir} (files: {copied or ['none']})")
-        return str(snapshot_dir)
+        return arch_log, str(snapshot_dir), messages
 
     def _capture_model_artifact(self, cycle_dir: Path) -> Optional[str]:
         """Copy best model artifact for this cycle into cycle artifacts directory."""
-        workspace = self.config.get_paths()["workspace"]
-        candidates = [
-            workspace / "best_model.pt",
-            workspace / "artifacts" / "best_model.pt",
-            workspace / "outputs" / "best_model.pt",
-            workspace / "model.pth",
-            workspace / "checkpoint.pt",
-        ]
+        workspace = self._workspace
+
+        artifact_source: Optional[Path] = None
+        artifact_stat: Optional[os.stat_result] = None
+
+        # The artifact location is usually stable across cycles, so stat the candidates up
+        # to the last hit in priority order; a higher-priority file written since still wins.
+        if self._artifact_rank is not None:
+            for rel_path in ARTIFACT_RELPATHS[: self._artifact_rank + 1]:
+                candidate = workspace / rel_path
+                try:
+                    st = os.stat(candidate)
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    artifact_source, artifact_stat = candidate, st
+                    break
 
-        artifact_source = next((p for p in candidates if p.exists() and p.is_file()), None)
         if artifact_source is None:
+            found = self._find_model_artifact(workspace)
+            if found is not None:
+                artifact_source, artifact_stat = found
+
+        if artifact_source is None or artifact_stat is None:
             return None
+        self._artifact_rank = ARTIFACT_RELPATHS.index(
+            artifact_source.relative_to(workspace).as_posix()
+        )
 
         artifact_dir = cycle_dir / "artifacts"
-        artifact_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(artifact_dir)
         target_path = artifact_dir / artifact_source.name
-        shutil.copy2(artifact_source, target_path)
+        # A re-run of this cycle after a crash can find a hardlink to the previous cycle's
+        # copy here; writing through it would overwrite that cycle's weights.
+        try:
+            os.unlink(target_path)
+        except FileNotFoundError:
+            pass
+
+        # Unchanged since the previous cycle: link the previous copy instead of re-copying.
+        cache_key = (str(artifact_source), artifact_stat.st_mtime_ns, artifact_stat.st_size)
+        cached = self._artifact_cache
+        if cached is not None and cached[0] == cache_key and cached[1].exists():
+            try:
+                os.link(cached[1], target_path)
+                return str(target_path)
+            except OSError:
+                pass
+
+        _clone_file(artifact_source, target_path)
+        os.utime(target_path, ns=(artifact_stat.st_atime_ns, artifact_stat.st_mtime_ns))
+        self._artifact_cache = (cache_key, target_path)
         return str(target_path)
 
-    def _write_best_model_index(self) -> None:
-        """Write a single JSON pointer for the current best model."""
-        index_path = self.state_path.parent.parent / "best_model_index.json"
+    @staticmethod
+    def _find_model_artifact(workspace: Path) -> Optional[tuple[Path, os.stat_result]]:
+        """Locate the highest-priority model artifact with one directory listing per location."""
+        found: dict[str, os.DirEntry[str]] = {}
+        for sub_dir in _ARTIFACT_DIRS:
+            try:
+                with os.scandir(workspace / sub_dir) as entries:
+                    for entry in entries:
+                        if entry.name in _ARTIFACT_NAMES and entry.is_file():
+                            found[f"{sub_dir}/{entry.name}" if sub_dir else entry.name] = entry
+            except (FileNotFoundError, NotADirectoryError):
+                continue
 
-        target = self.config.project.target_metric
+        for rel_path in ARTIFACT_RELPATHS:
+            entry = found.get(rel_path)
+            if entry is not None:
+                return Path(entry.path), entry.stat()
+        return None
+
+    def _write_best_model_index(self, updated_at: Optional[str] = None) -> None:
+        """Write a single JSON pointer for the current best model.
+
+        Args:
+            updated_at: Timestamp to record, when the caller already took one
+        """
+        target = self._target
         payload: dict[str, Any] = {
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": updated_at or _now_iso(),
             "objective": {
                 "name": target.name,
-                "direction": target.get_direction(),
+                "direction": self._target_dir,
                 "target_value": target.value,
-                "comparator": target.comparator_symbol(),
+                "comparator": self._target_sym,
             },
             "best_cycle": self.state.best_cycle,
             "best_metric": self.state.best_metric,
@@ -1013,9 +1627,9 @@ Best achieved: {self.state.best_metric} (Cycle {self.state.best_cycle})
             "best_source_snapshot": None,
         }
 
-        if self.state.best_cycle > 0 and len(self.state.history) >= self.state.best_cycle:
-            best_snapshot = self.state.history[self.state.best_cycle - 1]
-            metric_value = best_snapshot.metrics.result.model_dump().get(target.name)
+        best_snapshot = self._best_snapshot
+        if best_snapshot is not None:
+            metric_value = best_snapshot.metrics.get_target_value()
             if isinstance(metric_value, (int, float)):
                 payload["best_metric"] = float(metric_value)
                 payload["target_met"] = target.target_is_met(float(metric_value))
@@ -1029,4 +1643,4 @@ Best achieved: {self.state.best_metric} (Cycle {self.state.best_cycle})
             if best_snapshot.source_snapshot_dir:
                 payload["best_source_snapshot"] = best_snapshot.source_snapshot_dir
 
-        index_path.write_text(json.dumps(payload, indent=2))
+        _write_json(self._best_index_path, payload, atomic=True)